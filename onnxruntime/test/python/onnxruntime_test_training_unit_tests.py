@@ -16,7 +16,8 @@ from onnxruntime_test_ort_trainer import map_optimizer_attributes, ort_trainer_l
 from helper import get_name
 import onnxruntime
 from onnxruntime_test_training_unittest_utils import process_dropout
-from onnxruntime.capi.ort_trainer import ORTTrainer, IODescription, ModelDescription, LossScaler, generate_sample
+from onnxruntime.capi.ort_trainer import ORTTrainer, IODescription, ModelDescription, LossScaler, StaticLossScaler, \
+    make_loss_scaler, generate_sample
 
 torch.manual_seed(1)
 onnxruntime.set_seed(1)
@@ -71,6 +72,75 @@ class TestTrainingDropout(unittest.TestCase):
         train_output_2 = model.train_step(*input_args)
         assert_allclose(expected_training_output, train_output_2.item(), rtol=rtol, err_msg="dropout training loss 2 mismatch")
 
+class TestLossScaler(unittest.TestCase):
+    def testLossScalerDeviceUpdateMatchesHostUpdate(self):
+        host_scaler = LossScaler('loss_scale_input_name', True, up_scale_window=2)
+        device_scaler = LossScaler('loss_scale_input_name', True, up_scale_window=2)
+        loss_scale = torch.tensor([device_scaler.loss_scale_])
+        stable_steps = torch.tensor([0])
+        for all_finite in [True, True, True, False, True, False, False, True, True]:
+            host_scaler.update_loss_scale(all_finite)
+            loss_scale, stable_steps = device_scaler.update_loss_scale_device(
+                torch.tensor([all_finite]), loss_scale, stable_steps)
+            assert_allclose(host_scaler.loss_scale_, loss_scale.item())
+            assert host_scaler.stable_steps_ == stable_steps.item()
+
+    def testLossScalerUpScaleWindowHeuristic(self):
+        assert LossScaler('loss_scale_input_name', True).up_scale_window_ == 2000
+        assert LossScaler('loss_scale_input_name', True, effective_batch_size=16, world_size=4).up_scale_window_ == 256
+        assert LossScaler('loss_scale_input_name', True, effective_batch_size=4096, world_size=8).up_scale_window_ == 1
+        loss_scaler = LossScaler('loss_scale_input_name', True, up_scale_window=10, effective_batch_size=16)
+        assert loss_scaler.up_scale_window_ == 10
+
+    def testLossScalerGrowthAndBackoffFactors(self):
+        loss_scaler = LossScaler('loss_scale_input_name', True, loss_scale=64.0, up_scale_window=1,
+                                 growth_factor=4.0, backoff_factor=0.25)
+        loss_scaler.update_loss_scale(True)
+        assert_allclose(loss_scaler.loss_scale_, 256.0)
+        loss_scaler.update_loss_scale(False)
+        assert_allclose(loss_scaler.loss_scale_, 64.0)
+
+    def testLossScalerAdaptiveWindow(self):
+        loss_scaler = LossScaler('loss_scale_input_name', True, up_scale_window=2000, adaptive=True)
+        assert loss_scaler.up_scale_window_ == 20
+        for _ in range(3 * 20):
+            loss_scaler.update_loss_scale(True)
+        assert loss_scaler.up_scale_window_ == 50
+        for _ in range(6):
+            loss_scaler.update_loss_scale(False)
+        assert loss_scaler.up_scale_window_ == 1
+        loss_scaler.reset()
+        assert loss_scaler.up_scale_window_ == 20
+
+    def testLossScalerRepeatedScalingIsExact(self):
+        loss_scaler = LossScaler('loss_scale_input_name', True, up_scale_window=1)
+        for _ in range(1000):
+            loss_scaler.update_loss_scale(False)
+            loss_scaler.update_loss_scale(True)
+        assert loss_scaler.loss_scale_ == float(1 << 16)
+        for _ in range(100):
+            loss_scaler.update_loss_scale(False)
+        assert loss_scaler.loss_scale_ == loss_scaler.min_loss_scale_
+        for _ in range(100):
+            loss_scaler.update_loss_scale(True)
+        assert loss_scaler.loss_scale_ == loss_scaler.max_loss_scale_
+
+    def testStaticLossScaler(self):
+        loss_scaler = make_loss_scaler('loss_scale_input_name', is_dynamic_scale=False, loss_scale=128.0)
+        assert isinstance(loss_scaler, StaticLossScaler)
+        for all_finite in [True, False, True]:
+            loss_scaler.update_loss_scale(all_finite)
+            assert loss_scaler.loss_scale_ == 128.0
+        dynamic_loss_scaler = make_loss_scaler('loss_scale_input_name', loss_scale=128.0)
+        assert type(dynamic_loss_scaler) is LossScaler
+        assert dynamic_loss_scaler.is_dynamic_scale_
+        dynamic_loss_scaler.update_loss_scale(False)
+        assert dynamic_loss_scaler.loss_scale_ == 64.0
+        with pytest.raises(ValueError):
+            make_loss_scaler('loss_scale_input_name', is_dynamic_scale=False, up_scale_window=10)
+        with pytest.warns(DeprecationWarning):
+            LossScaler('loss_scale_input_name', False)
+
 if __name__ == '__main__':
     unittest.main(module=__name__, buffer=True)
 
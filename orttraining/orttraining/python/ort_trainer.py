@@ -921,7 +921,9 @@ class ORTTrainer():
             # because all_fp32_gradients_finite is still in the feed.
             self.train_io_binding.clear_binding_outputs()
 
-            all_finite = session_run_results[self.output_desc_with_all_fp_16_or_fp32_gradients_finite[-1].name_]
+            # all_finite lives on the training device. Copy it to the host once here instead of
+            # letting each truth test below trigger its own device-to-host copy.
+            all_finite = session_run_results[self.output_desc_with_all_fp_16_or_fp32_gradients_finite[-1].name_].item()
             if self.loss_scaler_ is not None:
                 self.loss_scaler_.update_loss_scale(all_finite)
             if all_finite:
@@ -1005,19 +1007,91 @@ class ORTTrainer():
                 "the first output of a model to run with fully optimized ORT backend assumed to be loss and must be a scalar.")
 
 class LossScaler():
+    __slots__ = ('loss_scale_input_name_', 'is_dynamic_scale_', 'initial_loss_scale_', 'up_scale_window_',
+                 'growth_factor_', 'backoff_factor_', 'min_loss_scale_', 'max_loss_scale_', 'loss_scale_',
+                 'stable_steps_', 'adaptive_', '_window_list', '_window_idx', '_consecutive_up',
+                 '_consecutive_down')
+
     def __init__(self, loss_scale_input_name, is_dynamic_scale,
                  loss_scale=float(1 << 16),
-                 up_scale_window=2000,
-                 min_loss_scale=1.0, max_loss_scale=float(1 << 24)):
+                 up_scale_window=None,
+                 min_loss_scale=1.0, max_loss_scale=float(1 << 24),
+                 growth_factor=2.0, backoff_factor=0.5,
+                 effective_batch_size=None, world_size=1, adaptive=False):
+        """
+        Initialize LossScaler.
+
+        Args:
+            loss_scale_input_name: name of the loss scale input to the training model.
+            is_dynamic_scale: whether the loss scale is updated by update_loss_scale.
+            loss_scale: initial loss scale.
+               Defaults to 65536.
+            up_scale_window: number of consecutive steps with finite gradients
+               before the loss scale is increased. When None, it is derived from
+               'effective_batch_size' and 'world_size' if the batch size is given,
+               otherwise it defaults to 2000.
+            min_loss_scale: lower bound of the loss scale.
+               Defaults to 1.0.
+            max_loss_scale: upper bound of the loss scale.
+               Defaults to 16777216.
+            growth_factor: factor the loss scale is multiplied by when increased.
+               Defaults to 2.0.
+            backoff_factor: factor the loss scale is multiplied by on overflow.
+               Defaults to 0.5.
+            effective_batch_size: per-rank batch size including gradient accumulation.
+               Only used to derive 'up_scale_window'.
+               Defaults to None.
+            world_size: number of ranks participating in distributed training.
+               Only used to derive 'up_scale_window'.
+               Defaults to 1.
+            adaptive: enables adaptive loss scaling, where 'up_scale_window' starts
+               small and moves along an increasing window list: every 3 consecutive
+               up-scales advance to the next (larger) window and every 3 consecutive
+               overflows retreat to the previous one. Overrides 'up_scale_window'.
+               Defaults to False.
+        """
         super(LossScaler, self).__init__()
+        if not is_dynamic_scale and type(self) is LossScaler:
+            warnings.warn("LossScaler with is_dynamic_scale=False is deprecated. Use StaticLossScaler instead.",
+                          DeprecationWarning)
+        if up_scale_window is None:
+            if effective_batch_size is None:
+                up_scale_window = 2000
+            else:
+                up_scale_window = max(1, int(2**14 / (effective_batch_size * world_size)))
         self.loss_scale_input_name_ = loss_scale_input_name
         self.is_dynamic_scale_ = is_dynamic_scale
         self.initial_loss_scale_ = loss_scale
         self.up_scale_window_ = up_scale_window
+        self.growth_factor_ = growth_factor
+        self.backoff_factor_ = backoff_factor
         self.min_loss_scale_ = min_loss_scale
         self.max_loss_scale_ = max_loss_scale
         self.loss_scale_ = loss_scale
         self.stable_steps_ = 0
+        self.adaptive_ = adaptive
+        self._window_list = [1, 20, 50, 100, 200, 500, 1000, 2000]
+        self._reset_adaptive_window()
+
+    def _reset_adaptive_window(self):
+        self._window_idx = 1
+        self._consecutive_up = 0
+        self._consecutive_down = 0
+        if self.adaptive_:
+            self.up_scale_window_ = self._window_list[self._window_idx]
+
+    def _adapt_up_scale_window(self, is_up_scale):
+        if is_up_scale:
+            self._consecutive_up += 1
+            self._consecutive_down = 0
+            if self._consecutive_up % 3 == 0:
+                self._window_idx = min(self._window_idx + 1, len(self._window_list) - 1)
+        else:
+            self._consecutive_down += 1
+            self._consecutive_up = 0
+            if self._consecutive_down % 3 == 0:
+                self._window_idx = max(self._window_idx - 1, 0)
+        self.up_scale_window_ = self._window_list[self._window_idx]
 
     def update_loss_scale(self, is_all_finite):
         if not self.is_dynamic_scale_:
@@ -1027,12 +1101,71 @@ class LossScaler():
             self.stable_steps_ += 1
 
             if self.stable_steps_ >= self.up_scale_window_:
-                self.loss_scale_ = min(self.max_loss_scale_, self.loss_scale_ * 2)
+                self.loss_scale_ = min(self.max_loss_scale_, self.loss_scale_ * self.growth_factor_)
                 self.stable_steps_ = 0
+                if self.adaptive_:
+                    self._adapt_up_scale_window(True)
         else:
-            self.loss_scale_ = max(self.min_loss_scale_, self.loss_scale_ / 2)
+            self.loss_scale_ = max(self.min_loss_scale_, self.loss_scale_ * self.backoff_factor_)
             self.stable_steps_ = 0
+            if self.adaptive_:
+                self._adapt_up_scale_window(False)
+
+    def update_loss_scale_device(self, is_all_finite, loss_scale, stable_steps):
+        """
+        Device-side counterpart of update_loss_scale.
+
+        is_all_finite, loss_scale and stable_steps are tensors living on the training device.
+        The update is expressed with torch.where so the all_finite flag never has to be copied
+        back to the host. Returns the updated (loss_scale, stable_steps) tensors.
+        Adaptive windows are not applied here since they depend on host-side event counts.
+        """
+        if not self.is_dynamic_scale_:
+            return loss_scale, stable_steps
+
+        stable_steps = stable_steps + 1
+        up_scale = stable_steps >= self.up_scale_window_
+        grown = torch.clamp(loss_scale * self.growth_factor_, max=self.max_loss_scale_)
+        up_scaled = torch.where(up_scale, grown, loss_scale)
+        down_scaled = torch.clamp(loss_scale * self.backoff_factor_, min=self.min_loss_scale_)
+        loss_scale = torch.where(is_all_finite, up_scaled, down_scaled)
+        stable_steps = torch.where(is_all_finite & ~up_scale, stable_steps, torch.zeros_like(stable_steps))
+        return loss_scale, stable_steps
 
     def reset(self):
         self.loss_scale_ = self.initial_loss_scale_
         self.stable_steps_ = 0
+        self._reset_adaptive_window()
+
+
+class StaticLossScaler(LossScaler):
+    __slots__ = ()
+
+    def __init__(self, loss_scale_input_name, loss_scale=float(1 << 16)):
+        """
+        Initialize StaticLossScaler, a loss scaler whose loss scale never changes.
+
+        Args:
+            loss_scale_input_name: name of the loss scale input to the training model.
+            loss_scale: constant loss scale.
+               Defaults to 65536.
+        """
+        super(StaticLossScaler, self).__init__(loss_scale_input_name, False, loss_scale)
+
+    def update_loss_scale(self, is_all_finite):
+        pass
+
+    def update_loss_scale_device(self, is_all_finite, loss_scale, stable_steps):
+        return loss_scale, stable_steps
+
+
+def make_loss_scaler(loss_scale_input_name, is_dynamic_scale=True, loss_scale=float(1 << 16), **kwargs):
+    """
+    Create a LossScaler when is_dynamic_scale is True, otherwise a StaticLossScaler.
+    kwargs are forwarded to LossScaler and must be empty for a static loss scale.
+    """
+    if is_dynamic_scale:
+        return LossScaler(loss_scale_input_name, True, loss_scale, **kwargs)
+    if kwargs:
+        raise ValueError("StaticLossScaler does not accept: {}".format(', '.join(sorted(kwargs))))
+    return StaticLossScaler(loss_scale_input_name, loss_scale)
@@ -52,6 +52,8 @@ TEST(IsFiniteTest, MLFloat16) {
   test.Run();
 }
 
+#endif
+
 TEST(IsAllFiniteTest, FalseFloat) {
   OpTester test("IsAllFinite", 1, kMSDomain);
 
@@ -223,7 +225,5 @@ TEST(IsAllFiniteTest, MoreFalseFloatTensorLargeFloat16) {
   test.Run();
 }
 
-#endif
-
 }  // namespace test
 }  // namespace onnxruntime
\ No newline at end of file
@@ -0,0 +1,62 @@
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT License.
+
+#include "orttraining/training_ops/cpu/math/isfinite.h"
+
+#include "core/util/math_cpuonly.h"
+
+namespace onnxruntime {
+namespace contrib {
+
+#define REGISTER_ISALLFINITE_KERNEL_TYPED(T)                         \
+  ONNX_OPERATOR_TYPED_KERNEL_EX(                                     \
+      IsAllFinite,                                                   \
+      kMSDomain,                                                     \
+      1,                                                             \
+      T,                                                             \
+      kCpuExecutionProvider,                                         \
+      KernelDefBuilder()                                             \
+          .TypeConstraint("V", DataTypeImpl::GetTensorType<T>())     \
+          .TypeConstraint("T", DataTypeImpl::GetTensorType<bool>()), \
+      IsAllFiniteOp<T>);
+
+namespace {
+template <typename T>
+bool IsAllFiniteImpl(const T* data, int64_t size) {
+  return ConstEigenVectorArrayMap<T>(data, size).isFinite().all();
+}
+
+template <>
+bool IsAllFiniteImpl<MLFloat16>(const MLFloat16* data, int64_t size) {
+  // A half value is inf or nan iff all of its exponent bits are set.
+  for (int64_t i = 0; i < size; ++i) {
+    if ((data[i].val & 0x7C00) == 0x7C00) {
+      return false;
+    }
+  }
+  return true;
+}
+}  // namespace
+
+template <typename T>
+Status IsAllFiniteOp<T>::Compute(OpKernelContext* context) const {
+  // Visit all input tensors in a single kernel and stop at the first non-finite one.
+  bool is_all_finite = true;
+  const auto total_tensor_count = context->InputCount();
+  for (int i = 0; i < total_tensor_count && is_all_finite; ++i) {
+    const Tensor& input = *context->Input<Tensor>(i);
+    is_all_finite = IsAllFiniteImpl<T>(input.Data<T>(), input.Shape().Size());
+  }
+
+  Tensor& output = *context->Output(0, {});
+  *output.MutableData<bool>() = is_all_finite;
+
+  return Status::OK();
+}
+
+REGISTER_ISALLFINITE_KERNEL_TYPED(MLFloat16)
+REGISTER_ISALLFINITE_KERNEL_TYPED(float)
+REGISTER_ISALLFINITE_KERNEL_TYPED(double)
+
+}  // namespace contrib
+}  // namespace onnxruntime